@@ -1,11 +1,11 @@
 import { describe, it, expect, vi, beforeEach, Mock } from 'vitest'
 import { POST, DELETE } from './route'
 import { getSessionUser } from '@/lib/auth'
-import { getUser, updateUserAvatar, deleteUserAvatar } from '@/lib/users'
+import { getUserAvatarUrl, updateUserAvatar, deleteUserAvatar } from '@/lib/users'
 
 vi.mock('@/lib/auth', () => ({ getSessionUser: vi.fn() }))
 vi.mock('@/lib/users', () => ({
-  getUser: vi.fn(),
+  getUserAvatarUrl: vi.fn(),
   updateUserAvatar: vi.fn(),
   deleteUserAvatar: vi.fn(),
 }))
@@ -61,7 +61,7 @@ function makePngFile(size = 100) {
 
 beforeEach(() => {
   vi.clearAllMocks()
-  ;(getUser as Mock).mockResolvedValue({ avatarUrl: null })
+  ;(getUserAvatarUrl as Mock).mockResolvedValue(null)
 })
 
 describe('POST /api/users/[id]/avatar — auth', () => {
@@ -123,7 +123,7 @@ describe('POST /api/users/[id]/avatar — success', () => {
   })
 
   it('calls updateUserAvatar with old url', async () => {
-    ;(getUser as Mock).mockResolvedValue({ avatarUrl: 'https://old.url/a.png' })
+    ;(getUserAvatarUrl as Mock).mockResolvedValue('https://old.url/a.png')
     const { request, params } = makeFormRequest('1', makePngFile())
     await POST(request, { params })
     expect(updateUserAvatar).toHaveBeenCalledWith({ userId: 1, avatarUrl: 'https://blob.vercel.app/avatars/1-123.png', oldAvatarUrl: 'https://old.url/a.png' })
@@ -159,7 +159,7 @@ describe('DELETE /api/users/[id]/avatar — success', () => {
   })
 
   it('calls deleteUserAvatar with the existing avatar url', async () => {
-    ;(getUser as Mock).mockResolvedValue({ avatarUrl: 'https://old.url/a.png' })
+    ;(getUserAvatarUrl as Mock).mockResolvedValue('https://old.url/a.png')
     const { request, params } = makeDeleteRequest('1')
     await DELETE(request, { params })
     expect(deleteUserAvatar).toHaveBeenCalledWith(1, 'https://old.url/a.png')
@@ -1,7 +1,7 @@
 import { NextResponse } from 'next/server'
 import { cookies } from 'next/headers'
 import { getSessionUser } from '@/lib/auth'
-import { getUser, updateUserAvatar, deleteUserAvatar } from '@/lib/users'
+import { getUserAvatarUrl, updateUserAvatar, deleteUserAvatar } from '@/lib/users'
 import { taskRunner } from '@/lib/TaskRunner'
 import { encrypt, SESSION_DURATION_MS } from '@/lib/session'
 
@@ -65,8 +65,7 @@ export async function POST(request: Request, { params }: { params: Promise<{ id:
     return NextResponse.json({ error: 'File must be JPEG, PNG, or WebP' }, { status: 400 })
   }
 
-  const user = await getUser(targetId)
-  const oldAvatarUrl = user?.avatarUrl ?? null
+  const oldAvatarUrl = await getUserAvatarUrl(targetId)
 
   const { put } = await import('@vercel/blob')
   const ext = EXT_MAP[file.type]
@@ -88,8 +87,7 @@ export async function DELETE(_request: Request, { params }: { params: Promise<{
     return NextResponse.json({ error: 'Forbidden' }, { status: 403 })
   }
 
-  const user = await getUser(targetId)
-  const oldAvatarUrl = user?.avatarUrl ?? null
+  const oldAvatarUrl = await getUserAvatarUrl(targetId)
 
   await taskRunner.run(() => deleteUserAvatar(targetId, oldAvatarUrl))
   await reissueSession(sessionUser, null)
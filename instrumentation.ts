@@ -1,6 +1,10 @@
 export async function register() {
   if (process.env.NEXT_RUNTIME === 'nodejs') {
     await import('./sentry.server.config')
+    // Session JWT and reset-token hashing ride on Node's bundled OpenSSL, which
+    // picks hardware SHA-256 (SHA-NI) at runtime. Log the linked build once at
+    // boot so a base-image change that swaps it out is visible in the logs.
+    console.log(`[startup] node ${process.version}, openssl ${process.versions.openssl}`)
   }
   if (process.env.NEXT_RUNTIME === 'edge') {
     await import('./sentry.edge.config')
@@ -1,6 +1,6 @@
 import { NextResponse } from 'next/server'
 import type { NextRequest } from 'next/server'
-import { getToken } from 'next-auth/jwt'
+import { getToken, type JWT } from 'next-auth/jwt'
 import { isbot } from 'isbot'
 import { hasUnlimitedRecipeAccess } from '@/lib/entitlements'
 import { decideMeter } from '@/lib/recipeMeter'
@@ -16,6 +16,33 @@ const PROTECTED_ROUTES = ['/pantry', '/profile', '/recipes/new', '/foods', '/foo
 // Routes exempt from the 90-day password reset redirect.
 const RESET_EXEMPT_PREFIXES = ['/reset-password', '/forgot-password', '/login', '/api/auth', '/logout']
 
+/** Escape a path literal for embedding in a RegExp. */
+function escapePath(path: string): string {
+  return path.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')
+}
+
+/** Compile a prefix list into a single anchored alternation. */
+function compilePrefixes(prefixes: string[]): RegExp {
+  return new RegExp(`^(?:${prefixes.map(escapePath).join('|')})`)
+}
+
+// Compiled once at module load — these checks run on every request, and a single
+// anchored regex match stays cheap as the route lists grow, unlike a
+// startsWith() pass per entry.
+const PROTECTED_ROUTES_RE = compilePrefixes(PROTECTED_ROUTES)
+const RESET_EXEMPT_RE = compilePrefixes(RESET_EXEMPT_PREFIXES)
+
+/**
+ * Decodes the session JWT lazily and at most once per request. Several checks
+ * below need the *verified* token (password-expiry flag, meter entitlement);
+ * without this each would call getToken() independently and re-verify the same
+ * cookie's signature two or three times on a single request.
+ */
+function createTokenReader(request: NextRequest): () => Promise<JWT | null> {
+  let cached: Promise<JWT | null> | undefined
+  return () => (cached ??= getToken({ req: request, secret: process.env.AUTH_SECRET }))
+}
+
 /** True when the incoming request carries any recognised session cookie. */
 function detectSessionCookie(request: NextRequest): boolean {
   return (
@@ -33,6 +60,7 @@ function detectSessionCookie(request: NextRequest): boolean {
 async function checkResetPasswordAccess(
   request: NextRequest,
   hasSessionCookie: boolean,
+  readToken: () => Promise<JWT | null>,
 ): Promise<NextResponse | null> {
   if (request.nextUrl.searchParams.has('token')) return null
 
@@ -40,7 +68,7 @@ async function checkResetPasswordAccess(
     return NextResponse.redirect(new URL('/login', request.nextUrl))
   }
 
-  const token = await getToken({ req: request, secret: process.env.AUTH_SECRET })
+  const token = await readToken()
   if (!token?.needsPasswordReset) {
     return NextResponse.redirect(new URL('/login', request.nextUrl))
   }
@@ -57,11 +85,12 @@ async function checkPasswordExpiryRedirect(
   request: NextRequest,
   pathname: string,
   hasSessionCookie: boolean,
+  readToken: () => Promise<JWT | null>,
 ): Promise<NextResponse | null> {
-  const isExempt = RESET_EXEMPT_PREFIXES.some((p) => pathname.startsWith(p))
+  const isExempt = RESET_EXEMPT_RE.test(pathname)
   if (isExempt || !hasSessionCookie) return null
 
-  const token = await getToken({ req: request, secret: process.env.AUTH_SECRET })
+  const token = await readToken()
   if (token?.needsPasswordReset) {
     return NextResponse.redirect(new URL('/reset-password', request.nextUrl))
   }
@@ -79,7 +108,7 @@ function checkProtectedRoute(
   pathname: string,
   hasSessionCookie: boolean,
 ): NextResponse | null {
-  const isProtected = PROTECTED_ROUTES.some((route) => pathname.startsWith(route))
+  const isProtected = PROTECTED_ROUTES_RE.test(pathname)
   if (isProtected && !hasSessionCookie) {
     return NextResponse.redirect(new URL('/login', request.nextUrl))
   }
@@ -100,6 +129,7 @@ async function meterRecipeView(
   request: NextRequest,
   pathname: string,
   hasSessionCookie: boolean,
+  readToken: () => Promise<JWT | null>,
 ): Promise<NextResponse | null> {
   if (request.method !== 'GET') return null
 
@@ -110,9 +140,7 @@ async function meterRecipeView(
   // Entitlement is decided against a *verified* session, not mere cookie
   // presence — a stale or forged session cookie must not grant Unlimited
   // Recipe Access and silently bypass the meter.
-  const isAuthenticated = hasSessionCookie
-    ? (await getToken({ req: request, secret: process.env.AUTH_SECRET })) !== null
-    : false
+  const isAuthenticated = hasSessionCookie ? (await readToken()) !== null : false
   if (hasUnlimitedRecipeAccess({ isAuthenticated })) return null
   if (isbot(request.headers.get('user-agent') ?? '')) return null
 
@@ -142,19 +170,20 @@ async function meterRecipeView(
 export async function proxy(request: NextRequest) {
   const { pathname } = request.nextUrl
   const hasSessionCookie = detectSessionCookie(request)
+  const readToken = createTokenReader(request)
 
   if (pathname.startsWith('/reset-password')) {
-    const redirect = await checkResetPasswordAccess(request, hasSessionCookie)
+    const redirect = await checkResetPasswordAccess(request, hasSessionCookie, readToken)
     return redirect ?? NextResponse.next()
   }
 
-  const expiryRedirect = await checkPasswordExpiryRedirect(request, pathname, hasSessionCookie)
+  const expiryRedirect = await checkPasswordExpiryRedirect(request, pathname, hasSessionCookie, readToken)
   if (expiryRedirect) return expiryRedirect
 
   const protectedRedirect = checkProtectedRoute(request, pathname, hasSessionCookie)
   if (protectedRedirect) return protectedRedirect
 
-  const meteredResponse = await meterRecipeView(request, pathname, hasSessionCookie)
+  const meteredResponse = await meterRecipeView(request, pathname, hasSessionCookie, readToken)
   if (meteredResponse) return meteredResponse
 
   return NextResponse.next()
@@ -1,4 +1,5 @@
 import 'server-only'
+import { cache } from 'react'
 import { auth } from '@/auth'
 
 export type SessionUser = {
@@ -9,12 +10,18 @@ export type SessionUser = {
   needsPasswordReset: boolean
 }
 
+// Parsed once at module load — the admin id is fixed for the process lifetime,
+// so every isAdmin() call shouldn't re-read and re-parse the env var.
+const ADMIN_USER_ID = process.env.ADMIN_USER_ID !== undefined ? Number(process.env.ADMIN_USER_ID) : undefined
+
 export function isAdmin(userId: number): boolean {
-  const adminId = process.env.ADMIN_USER_ID
-  return adminId !== undefined && userId === Number(adminId)
+  return ADMIN_USER_ID !== undefined && userId === ADMIN_USER_ID
 }
 
-export async function getSessionUser(): Promise<SessionUser | null> {
+// Memoised per request with React cache(): a single render can hit this from
+// the layout, the page, and nested components, and every bare auth() call
+// re-verifies the session cookie. One verification per request is enough.
+export const getSessionUser = cache(async (): Promise<SessionUser | null> => {
   const session = await auth()
   if (!session?.user?.id) return null
   return {
@@ -24,4 +31,4 @@ export async function getSessionUser(): Promise<SessionUser | null> {
     needsOnboarding: (session.user as { needsOnboarding?: boolean }).needsOnboarding ?? false,
     needsPasswordReset: (session.user as { needsPasswordReset?: boolean }).needsPasswordReset ?? false,
   }
-}
+})
@@ -27,6 +27,14 @@ describe('recipe meter cookie codec', () => {
     expect(await readMeter(`${body}.${sig}`, SECRET)).toEqual(payload)
   })
 
+  it('round-trips a payload larger than the base64 encoding chunk size', async () => {
+    // The encoder converts bytes to text in 4 KiB chunks; an ids list this long
+    // produces a body spanning several chunks and exercises the boundaries.
+    const big: MeterPayload = { periodStart: 1_700_000_000_000, ids: Array.from({ length: 2000 }, (_, i) => `id${i}padpad`) }
+    const cookie = await signMeter(big, SECRET)
+    expect(await readMeter(cookie, SECRET)).toEqual(big)
+  })
+
   it('returns null for missing or malformed cookies', async () => {
     expect(await readMeter(undefined, SECRET)).toBeNull()
     expect(await readMeter('', SECRET)).toBeNull()
@@ -33,8 +33,14 @@ const decoder = new TextDecoder()
 // `/` characters (which have special meaning there) for `-` and `_`, and drops
 // the trailing `=` padding. These two helpers convert raw bytes <-> that text.
 function b64urlEncode(bytes: Uint8Array): string {
+  // Convert via fromCharCode's variadic form in chunks — one engine call per
+  // 4 KiB instead of one string append per byte. Chunking keeps the argument
+  // count well under engine limits for oversized payloads.
+  const CHUNK = 0x1000
   let binary = ''
-  for (const byte of bytes) binary += String.fromCharCode(byte)
+  for (let i = 0; i < bytes.length; i += CHUNK) {
+    binary += String.fromCharCode(...bytes.subarray(i, i + CHUNK))
+  }
   return btoa(binary).replace(/\+/g, '-').replace(/\//g, '_').replace(/=+$/, '')
 }
 
@@ -50,14 +56,27 @@ function b64urlDecode(value: string): Uint8Array {
 // Turn the plain-string AUTH_SECRET into a CryptoKey the Web Crypto API can use
 // to sign and verify. Same secret in = same key out, which is what lets the
 // server reproduce (and thus check) a signature it made earlier.
-async function hmacKey(secret: string): Promise<CryptoKey> {
-  return crypto.subtle.importKey(
-    'raw',
-    encoder.encode(secret),
-    { name: 'HMAC', hash: 'SHA-256' },
-    false,
-    ['sign', 'verify'],
-  )
+//
+// importKey runs on every metered request (once to read the cookie, once to
+// write it back), and the secret never changes within a process — so the
+// derived key is memoised. Keyed on the secret string rather than cached
+// unconditionally so tests exercising multiple secrets still get distinct keys.
+let cachedKey: { secret: string; key: Promise<CryptoKey> } | undefined
+
+function hmacKey(secret: string): Promise<CryptoKey> {
+  if (cachedKey?.secret !== secret) {
+    cachedKey = {
+      secret,
+      key: crypto.subtle.importKey(
+        'raw',
+        encoder.encode(secret),
+        { name: 'HMAC', hash: 'SHA-256' },
+        false,
+        ['sign', 'verify'],
+      ),
+    }
+  }
+  return cachedKey.key
 }
 
 /**
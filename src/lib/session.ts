@@ -3,22 +3,40 @@ import { SignJWT, jwtVerify, type JWTPayload } from 'jose'
 
 export const SESSION_DURATION_MS = 60 * 60 * 1000 // 1 hour
 
+// Identical for every token issued — built once instead of per encrypt() call.
+const PROTECTED_HEADER = { alg: 'HS256' } as const
+
+// Encoded once and reused — the secret doesn't change over a process lifetime,
+// so there's no reason to re-encode it on every sign/verify. Resolved lazily
+// (not at module load) so importing this file without JWT_SECRET set doesn't throw.
+let encodedKey: Uint8Array | undefined
+
 function getEncodedKey(): Uint8Array {
-    const secret = process.env.JWT_SECRET
-    if (!secret) throw new Error('JWT_SECRET environment variable is not set')
-    return new TextEncoder().encode(secret)
+    if (!encodedKey) {
+        const secret = process.env.JWT_SECRET
+        if (!secret) throw new Error('JWT_SECRET environment variable is not set')
+        encodedKey = new TextEncoder().encode(secret)
+    }
+    return encodedKey
+}
+
+/** Claims carried by the session token. */
+export type SessionPayload = {
+    userId: number
+    username: string
+    avatarUrl: string | null
 }
 
-export async function encrypt(data: object): Promise<string> {
-    return new SignJWT(data as JWTPayload)
-        .setProtectedHeader({ alg: 'HS256' })
+export async function encrypt(payload: SessionPayload): Promise<string> {
+    return new SignJWT(payload)
+        .setProtectedHeader(PROTECTED_HEADER)
         .setExpirationTime(Math.floor((Date.now() + SESSION_DURATION_MS) / 1000))
         .sign(getEncodedKey())
 }
 
-export async function decrypt(token: string): Promise<object> {
+export async function decrypt(token: string): Promise<SessionPayload & JWTPayload> {
     try {
-        const { payload } = await jwtVerify(token, getEncodedKey())
+        const { payload } = await jwtVerify<SessionPayload>(token, getEncodedKey())
         return payload
     } catch (error: unknown) {
         throw new Error(error instanceof Error ? error.message : 'Invalid token')
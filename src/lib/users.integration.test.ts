@@ -161,6 +161,32 @@ describe('users integration tests', () => {
         await expect(login({ username: 'testnonexistent', password: 'password123', ipAddress: '192.168.1.1' })).rejects.toThrow('Too many failed login attempts. Please try again later.')
     })
 
+    it('should upgrade a lower-cost password hash on successful login', async () => {
+        const bcrypt = (await import('bcrypt')).default
+        // Stored below the configured work factor (default 10), as if hashed
+        // before the cost was raised.
+        const lowCostHash = await bcrypt.hash('password123', 4)
+        await pool.query(
+            "INSERT INTO users (username, email, password) VALUES ('testrehash', 'testrehash@gmail.com', $1)",
+            [lowCostHash]
+        )
+
+        const loggedIn = await login({ username: 'testrehash', password: 'password123', ipAddress: '127.0.0.1' })
+        expect(loggedIn.username).toBe('testrehash')
+
+        // The rehash is fire-and-forget, so poll briefly for the updated row.
+        let stored = lowCostHash
+        for (let i = 0; i < 20 && stored === lowCostHash; i++) {
+            await new Promise((resolve) => setTimeout(resolve, 100))
+            const { rows } = await pool.query("SELECT password FROM users WHERE username = 'testrehash'")
+            stored = rows[0].password
+        }
+        expect(stored).toMatch(/^\$2[aby]\$10\$/)
+        // The upgraded hash still verifies the same password
+        const reLoggedIn = await login({ username: 'testrehash', password: 'password123', ipAddress: '127.0.0.1' })
+        expect(reLoggedIn.username).toBe('testrehash')
+    })
+
     it('should not block login attempts from a different IP', async () => {
         const user = {
             username: 'testlogin5',
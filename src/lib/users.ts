@@ -8,6 +8,34 @@ import { sendGoodbyeEmail, sendDeactivationExpiryWarningEmail } from '@/lib/emai
 
 const USERNAME_REGEX = /^[a-zA-Z0-9_-]{3,30}$/
 
+// Shared by the login rate-limit window, the password-reset rate-limit window,
+// and reset-token expiry.
+const ONE_HOUR_MS = 60 * 60 * 1000
+
+// Work factor for newly stored password hashes. Read once at module load;
+// deployments on faster hardware can raise it via env without a code change.
+// Existing hashes are upgraded transparently on the user's next login.
+const BCRYPT_ROUNDS = Number(process.env.BCRYPT_ROUNDS) || 10
+
+// Cost factor recorded in a stored bcrypt hash ('$2b$10$…' → 10), or null when
+// the prefix doesn't parse.
+function bcryptCost(hash: string): number | null {
+    const match = /^\$2[aby]\$(\d{2})\$/.exec(hash)
+    return match ? Number(match[1]) : null
+}
+
+// A bcrypt hash of random bytes that matches no password. login() compares
+// against it when the username is unknown so that path costs a full bcrypt
+// verification at the configured work factor — the same as a wrong password
+// for a real user. Built lazily (hashing at import would slow cold starts)
+// and cached for the process lifetime; it must track BCRYPT_ROUNDS, since a
+// cheaper dummy compare would reopen the enumeration timing oracle.
+let dummyPasswordHash: Promise<string> | undefined
+
+function getDummyPasswordHash(): Promise<string> {
+    return (dummyPasswordHash ??= bcrypt.hash(crypto.randomBytes(32).toString('hex'), BCRYPT_ROUNDS))
+}
+
 function mapUser(row: typeof users.$inferSelect): User {
   return {
     id: String(row.id),
@@ -27,8 +55,7 @@ function mapUser(row: typeof users.$inferSelect): User {
 }
 
 export async function hashPassword(password: string): Promise<string> {
-    const saltRounds = 10
-    return bcrypt.hash(password, saltRounds)
+    return bcrypt.hash(password, BCRYPT_ROUNDS)
 }
 
 export async function signUp(user: { username: string; email: string; password: string; cuisinePreferences: string[]; dietaryRestrictions: string[]; marketingEmailOptIn?: boolean }): Promise<User> {
@@ -58,25 +85,28 @@ export async function signUp(user: { username: string; email: string; password:
 }
 
 export async function login({ username, password, ipAddress }: { username: string; password: string; ipAddress: string }): Promise<User> {
-    const oneHourAgo = new Date(Date.now() - 60 * 60 * 1000)
+    const oneHourAgo = new Date(Date.now() - ONE_HOUR_MS)
 
-    // IP-based rate limit — catches attempts against non-existent usernames too
-    const recentFailedByIp = await db.select().from(login_attempts)
-        .where(and(
-            eq(login_attempts.ipAddress, ipAddress),
-            eq(login_attempts.successful, 0),
-            gte(login_attempts.dateAdded, oneHourAgo)
-        ))
+    // The IP rate-limit check and the user fetch are independent reads — run
+    // them concurrently so the login critical path pays one DB round trip here,
+    // not two. The IP limit catches attempts against non-existent usernames too.
+    const [recentFailedByIp, [user]] = await Promise.all([
+        db.select({ id: login_attempts.id }).from(login_attempts)
+            .where(and(
+                eq(login_attempts.ipAddress, ipAddress),
+                eq(login_attempts.successful, 0),
+                gte(login_attempts.dateAdded, oneHourAgo)
+            )),
+        db.select().from(users).where(eq(users.username, username)),
+    ])
 
     if (recentFailedByIp.length >= 5) {
         throw new Error('Too many failed login attempts. Please try again later.')
     }
 
-    const [user] = await db.select().from(users).where(eq(users.username, username))
-
     // Per-user rate limit — independent of IP so VPN rotation doesn't bypass it
     if (user) {
-        const recentFailedByUser = await db.select().from(login_attempts)
+        const recentFailedByUser = await db.select({ id: login_attempts.id }).from(login_attempts)
             .where(and(
                 eq(login_attempts.userId, user.id),
                 eq(login_attempts.successful, 0),
@@ -89,6 +119,10 @@ export async function login({ username, password, ipAddress }: { username: strin
     }
 
     if (!user || !user.password) {
+        // Burn a bcrypt verification anyway — returning early would make unknown
+        // usernames measurably faster than wrong passwords, a timing oracle for
+        // account enumeration. The result is deliberately ignored.
+        await bcrypt.compare(password, await getDummyPasswordHash())
         await trackLoginAttempt({ ipAddress, successful: false })
         throw new Error('Invalid username or password')
     }
@@ -103,6 +137,18 @@ export async function login({ username, password, ipAddress }: { username: strin
         throw new Error('ACCOUNT_DEACTIVATED')
     }
 
+    // Transparent work-factor upgrade: if BCRYPT_ROUNDS was raised since this
+    // hash was stored, re-hash now, while the verified plaintext is in hand —
+    // the only moment an upgrade is possible without forcing a reset.
+    // Fire-and-forget like the goodbye emails: a failure just means the next
+    // login retries. passwordChangedAt is deliberately untouched; the password
+    // itself didn't change, so the 90-day rotation clock must not reset.
+    if ((bcryptCost(user.password) ?? BCRYPT_ROUNDS) < BCRYPT_ROUNDS) {
+        hashPassword(password)
+            .then((rehashed) => db.update(users).set({ password: rehashed }).where(eq(users.id, user.id)))
+            .catch((err) => console.error('[login] password rehash failed for user', user.id, err))
+    }
+
     return mapUser(user)
 }
 
@@ -118,7 +164,7 @@ export async function trackLoginAttempt({ userId, successful, ipAddress }: { use
 // Successful logins always include a userId, so successful=1 + userId=null is
 // uniquely available to tag password-reset requests without touching the schema.
 export async function checkPasswordResetRateLimit(ipAddress: string): Promise<void> {
-    const oneHourAgo = new Date(Date.now() - 60 * 60 * 1000)
+    const oneHourAgo = new Date(Date.now() - ONE_HOUR_MS)
     const rows = await db.select({ id: login_attempts.id })
         .from(login_attempts)
         .where(and(
@@ -154,7 +200,7 @@ export async function createPasswordResetToken(email: string): Promise<{ token:
 
     const rawToken = crypto.randomBytes(32).toString('hex')
     const tokenHash = hashToken(rawToken)
-    const expiresAt = new Date(now.getTime() + 60 * 60 * 1000)
+    const expiresAt = new Date(now.getTime() + ONE_HOUR_MS)
 
     await db.insert(passwordResetTokens).values({
         userId: user.id,
@@ -217,6 +263,13 @@ export async function getUser(userId: number): Promise<User | null> {
     return mapUser(user)
 }
 
+// Narrow accessor for callers that only need the avatar — skips fetching and
+// mapping the full user row.
+export async function getUserAvatarUrl(userId: number): Promise<string | null> {
+    const [row] = await db.select({ avatarUrl: users.avatarUrl }).from(users).where(eq(users.id, userId))
+    return row?.avatarUrl ?? null
+}
+
 export async function updateUserAvatar({ userId, avatarUrl, oldAvatarUrl }: { userId: number; avatarUrl: string; oldAvatarUrl: string | null }): Promise<void> {
     await db.update(users).set({ avatarUrl }).where(eq(users.id, userId))
     if (oldAvatarUrl) {
@@ -256,7 +309,7 @@ export async function updateUserEmail(userId: number, newEmail: string): Promise
 }
 
 export async function updateUserPassword({ userId, currentPassword, newPassword }: { userId: number; currentPassword: string; newPassword: string }): Promise<void> {
-    const [user] = await db.select().from(users).where(eq(users.id, userId))
+    const [user] = await db.select({ password: users.password }).from(users).where(eq(users.id, userId))
     if (!user || !user.password) throw new Error('User not found')
     const match = await bcrypt.compare(currentPassword, user.password)
     if (!match) throw new Error('Current password is incorrect')
@@ -11,11 +11,12 @@ export const initialFoodsData: Food[] = [
   { id: 5, name: 'Ground Beef', calories: 200, protein: 26, carbs: 0, fat: 10, fiber: 0, servingSize: 100, servingUnit: 'g', measurements: [{ unit: 'g' }, { unit: 'oz' }, { unit: 'lb' }] },
 ]
 
-export const getInitialFoods = (): Food[] => JSON.parse(JSON.stringify(initialFoodsData))
+// structuredClone over JSON.parse(JSON.stringify(...)): same deep-copy
+// semantics for this plain data, without serialising to a string and back.
+export const getInitialFoods = (): Food[] => structuredClone(initialFoodsData)
 
 export const buildInitialRecipes = (): Recipe[] => {
   return []
 }
 
-export const getInitialRecipes = (): Recipe[] =>
-  JSON.parse(JSON.stringify(buildInitialRecipes()))
+export const getInitialRecipes = (): Recipe[] => structuredClone(buildInitialRecipes())